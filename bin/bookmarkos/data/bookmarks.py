@@ -2,12 +2,21 @@
 
 from dataclasses import dataclass, field
 import re
+from sys import intern
 from typing import Self
 
 
-# Regexen for extracting data from a A/H3 tag, and for extracting attributes
-EXTRACTION_RE = re.compile(r'^<\w+\s+(.*?)>(.*)</\w+>$')
-ATTRIB_RE = re.compile(r'(\w+)="(.*?)"')
+# Regexen for extracting data from a A/H3 tag, and for extracting attributes.
+# The negated character classes match the same text as a lazy `.*?` up to the
+# delimiter would, but without the engine having to try the delimiter after
+# every character.
+EXTRACTION_RE = re.compile(r'^<\w+\s+([^>\n]*)>(.*)</\w+>$')
+ATTRIB_RE = re.compile(r'(\w+)="([^"\n]*)"')
+
+# Bound methods of the above, so that `parse_fragment` doesn't look them up on
+# every call.
+_extract_match = EXTRACTION_RE.fullmatch
+_attrib_findall = ATTRIB_RE.findall
 
 
 type FolderContent = list['Folder | Bookmark']
@@ -15,7 +24,7 @@ type FolderContent = list['Folder | Bookmark']
 Bookmarks or other Folder objects."""
 
 
-@dataclass
+@dataclass(slots=True)
 class Node():
     """A base-class for Folder and Bookmark."""
 
@@ -29,7 +38,7 @@ class Node():
     "The parent path to this node, as a list of folder names"
 
 
-@dataclass
+@dataclass(slots=True)
 class Folder(Node):
     """A simple class for representing a folder."""
 
@@ -51,7 +60,7 @@ class Folder(Node):
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class Bookmark(Node):
     """A simple class for representing a bookmark."""
 
@@ -73,10 +82,16 @@ class Bookmark(Node):
         self.url = attrib['HREF']
         self.created = int(attrib['ADD_DATE'])
         self.updated = int(attrib['LAST_MODIFIED'])
-        visited = attrib.get('LAST_VISIT', None)
+        visited = attrib.get('LAST_VISIT')
         if visited is not None:
             self.visited = int(visited)
-        self.tags.extend(attrib.get('TAGS', '').split(', '))
+        # Assign the split list outright rather than extending the (empty)
+        # default one. A missing or empty TAGS leaves no tags at all (rather
+        # than a single empty-string tag). The same few tags recur across
+        # thousands of bookmarks, so they are interned to share a single
+        # string object per tag.
+        tags = attrib.get('TAGS')
+        self.tags = [intern(tag) for tag in tags.split(', ')] if tags else []
 
         return self
 
@@ -87,17 +102,12 @@ def parse_fragment(content: str) -> tuple[str, dict[str, str]]:
 
     # Pull apart `content`. Will result in the attributes as the first match
     # group and the text (that will be used as `name`) as the second group.
-    match = EXTRACTION_RE.fullmatch(content)
+    match = _extract_match(content)
     if match is None:
         raise ValueError(f'Parse-error on content: {content}')
 
-    attr = match.group(1)
-    text = match.group(2)
-
-    # Get all attributes. The `findall` method will return all matches as an
-    # iterator.
-    attrib: dict[str, str] = {}
-    for [key, value] in ATTRIB_RE.findall(attr):
-        attrib[key] = value
+    attr, text = match.groups()
 
-    return text, attrib
+    # Get all attributes. The `findall` method returns (key, value) pairs,
+    # which build the dict directly.
+    return text, dict(_attrib_findall(attr))
@@ -1,15 +1,17 @@
 """Home of all metrics-related processing and calculation, etc."""
 
-from bisect import bisect_left
-from collections import Counter, deque
-from datetime import datetime, timezone
-from itertools import groupby
-from operator import attrgetter, itemgetter
+from collections import Counter, defaultdict, deque
+from datetime import date
+from functools import lru_cache
 from typing import Dict, List, Tuple, Set
 
 from bookmarkos.data.bookmarks import Folder, Bookmark
 from bookmarkos.data.metrics import Metrics, SizeMetrics, SizeRankedList
 
+SECONDS_PER_DAY = 86400
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+FOLDER_SEPARATOR = ' ⟶ '
+
 
 def get_largest_and_smallest(
         sizes: Counter[str], n: int
@@ -25,41 +27,36 @@ def get_largest_and_smallest(
     Returns:
         Tuple of (largest, smallest) ranked lists
     """
-    if not sizes:
+    if not sizes or n <= 0:
         return [], []
 
     largest: SizeRankedList = []
     smallest: SizeRankedList = []
 
-    # Sort the elements by size.
-    sorted_sizes = sorted(sizes.items(), key=itemgetter(1), reverse=True)
-
-    # Group by size for proper rank assignment
-    ranked_with_ties: SizeRankedList = []
-    current_rank = 1
+    # Bucket the names by size in a single pass, so that only the (far fewer)
+    # distinct sizes need sorting rather than every element.
+    by_size: Dict[int, List[str]] = {}
+    for name, size in sizes.items():
+        by_size.setdefault(size, []).append(name)
+    distinct_sizes = sorted(by_size, reverse=True)
 
-    for size, group in groupby(sorted_sizes, key=itemgetter(1)):
-        group_items = list(group)
-        ranked_with_ties.append(
-            (current_rank, size, sorted([name for name, _ in group_items]))
-        )
-        current_rank += len(group_items)
-
-    # Extract the largest N and smallest N, accounting for ties.
+    # Extract the largest N and smallest N, accounting for ties. The rank of a
+    # size is one more than the number of items that are larger than it.
     largest_count = 0
     smallest_count = 0
 
-    for rank, size, names in ranked_with_ties:
-        if largest_count < n:
-            largest.append((rank, size, names))
-            largest_count += len(names)
+    for size in distinct_sizes:
+        names = by_size[size]
+        largest.append((largest_count + 1, size, sorted(names)))
+        largest_count += len(names)
         if largest_count >= n:
             break
 
-    for rank, size, names in reversed(ranked_with_ties):
-        if smallest_count < n:
-            smallest.append((rank, size, names))
-            smallest_count += len(names)
+    total = len(sizes)
+    for size in reversed(distinct_sizes):
+        names = by_size[size]
+        smallest_count += len(names)
+        smallest.append((total - smallest_count + 1, size, sorted(names)))
         if smallest_count >= n:
             break
 
@@ -69,61 +66,121 @@ def get_largest_and_smallest(
 def _gather_metrics(
         node: Folder, path: List[str], metrics: Metrics
 ) -> Counter[str]:
-    """Recursively gather metrics at folder `node`.
+    """Gather metrics for folder `node` and everything below it. The tree is
+    walked depth-first with an explicit stack rather than by recursion. The
+    size of each folder is recorded in `metrics.folders.sizes` as it is
+    visited.
+
+    Rather than a path list per folder, the stack carries the folder names
+    below the root already joined with the separator (or `None` when there
+    are none yet), so that each folder's identifier is built with a single
+    concatenation.
 
     Args:
-        node: Current folder being processed
-        path: Path to current folder as list of folder names
+        node: Root of the folders being processed
+        path: Path to `node` as list of folder names
         metrics: Metrics object to update
 
     Returns:
-        Counter mapping IDs to their bookmark counts (excluding subfolders)
+        Counter mapping IDs to their bookmark counts (excluding subfolders).
+        Folders that share an ID (same-named siblings) have their counts
+        summed, where `metrics.folders.sizes` keeps the last one visited.
     """
-    # Used to make unique identifier for the folder. The arrow character is used
-    # because folder names can (and do) contain "/".
-    folder_id = '(root)' if path == [''] else ' ⟶ '.join(path[1:])
-
-    # Update maximum depth
-    metrics.folders.max_depth = max(metrics.folders.max_depth, node.depth)
-
-    # Get the size, then separate content into bookmarks and sub-folders.
-    folder_size = len(node.content)
-    bookmarks = [x for x in node.content if isinstance(x, Bookmark)]
-    subfolders = [x for x in node.content if isinstance(x, Folder)]
-
-    # Folder-oriented metrics
-    metrics.folders.count += 1
-    metrics.folders.items.add(folder_id)
-    metrics.folders.sizes[folder_id] = folder_size
-    metrics.folders.max_size = max(metrics.folders.max_size, folder_size)
-    metrics.folders.min_size = min(metrics.folders.min_size, folder_size)
-
-    # Process bookmarks, for bookmark-oriented and tag-oriented metrics
-    metrics.bookmarks.count += len(bookmarks)
-    for bookmark in bookmarks:
-        metrics.bookmarks.items.add(bookmark.created)
-
-        num_tags = len(bookmark.tags)
-        metrics.tags.count += num_tags
-        metrics.tags.max_size = max(metrics.tags.max_size, num_tags)
-        metrics.tags.min_size = min(metrics.tags.min_size, num_tags)
-
-        for tag in bookmark.tags:
-            metrics.tags.items.add(tag)
-            metrics.tags.sizes[tag] += 1
-
-    # Initialize folder sizes counter for this level
-    folder_sizes: Counter[str] = Counter()
-    folder_sizes[folder_id] = folder_size
-
-    # Recurse into subfolders
-    for subfolder in subfolders:
-        # Create new path for subfolder
-        newpath = path + [subfolder.name]
-        subfolder_sizes = _gather_metrics(subfolder, newpath, metrics)
-        folder_sizes.update(subfolder_sizes)
-
-    return folder_sizes
+    folders = metrics.folders
+    bookmark_metrics = metrics.bookmarks
+    tags = metrics.tags
+    # Bound methods of the sets and Counters, looked up once for the walk.
+    add_folder_id = folders.items.add
+    folder_sizes = folders.sizes
+    folder_totals: Counter[str] = Counter()
+    add_bookmark_ids = bookmark_metrics.items.update
+    count_tags = tags.sizes.update
+    # The scalar metrics are kept in running locals, and written back once the
+    # walk is done.
+    max_depth = folders.max_depth
+    folder_count = folders.count
+    folder_max = folders.max_size
+    folder_min = folders.min_size
+    bookmark_count = bookmark_metrics.count
+    tag_count = tags.count
+    tag_max = tags.max_size
+    tag_min = tags.min_size
+
+    # Used to make unique identifier for the folder. The arrow character is
+    # used because folder names can (and do) contain "/".
+    joined = FOLDER_SEPARATOR.join(path[1:]) if len(path) > 1 else None
+    top_id = '(root)' if path == [''] else joined or ''
+
+    stack: List[Tuple[Folder, str | None, str]] = [(node, joined, top_id)]
+    while stack:
+        node, joined, folder_id = stack.pop()
+
+        # Update maximum depth
+        if node.depth > max_depth:
+            max_depth = node.depth
+
+        # Get the size, then separate content into bookmarks and sub-folders
+        # in a single pass.
+        folder_size = len(node.content)
+        bookmarks: List[Bookmark] = []
+        subfolders: List[Folder] = []
+        for item in node.content:
+            if isinstance(item, Bookmark):
+                bookmarks.append(item)
+            else:
+                subfolders.append(item)
+
+        # Folder-oriented metrics
+        folder_count += 1
+        add_folder_id(folder_id)
+        folder_sizes[folder_id] = folder_size
+        folder_totals[folder_id] += folder_size
+        if folder_size > folder_max:
+            folder_max = folder_size
+        if folder_size < folder_min:
+            folder_min = folder_size
+
+        # Process bookmarks, for bookmark-oriented and tag-oriented metrics.
+        # The IDs and tags of the whole folder are collected first, so that
+        # the set and the tag Counter are each updated in bulk.
+        bookmark_count += len(bookmarks)
+        add_bookmark_ids([bm.created for bm in bookmarks])
+
+        folder_tags: List[str] = []
+        for bookmark in bookmarks:
+            folder_tags += bookmark.tags
+
+        # The per-bookmark tag counts only move the overall max/min once per
+        # folder.
+        if bookmarks:
+            tag_counts = [len(bookmark.tags) for bookmark in bookmarks]
+            tag_max = max(tag_max, max(tag_counts))
+            tag_min = min(tag_min, min(tag_counts))
+
+        tag_count += len(folder_tags)
+        count_tags(folder_tags)
+
+        # Queue up the subfolders, in reverse so that they are popped (and
+        # visited) in their original order.
+        for subfolder in reversed(subfolders):
+            name = subfolder.name
+            if joined is not None:
+                name = f'{joined}{FOLDER_SEPARATOR}{name}'
+            stack.append((subfolder, name, name))
+
+    folders.max_depth = max_depth
+    folders.count = folder_count
+    folders.max_size = folder_max
+    folders.min_size = folder_min
+    bookmark_metrics.count = bookmark_count
+    # Every tag that was seen has a count in the Counter, so the set of unique
+    # tags is taken from its keys in one step rather than per folder.
+    tags.items.update(tags.sizes)
+    tags.count = tag_count
+    tags.max_size = tag_max
+    tags.min_size = tag_min
+
+    return folder_totals
 
 
 def average_size(metrics: SizeMetrics) -> float:
@@ -151,6 +208,22 @@ def average_size(metrics: SizeMetrics) -> float:
     return total / count
 
 
+@lru_cache(maxsize=None)
+def _day_to_date(day: int) -> str:
+    """Format the UTC day number `day` (days since the epoch) as YYYY-MM-DD.
+    Bookmarks cluster on a small number of days, so the results are cached.
+    Working from the day's ordinal avoids any timezone-aware `datetime`, and
+    `isoformat` is already the wanted format."""
+
+    return date.fromordinal(EPOCH_ORDINAL + day).isoformat()
+
+
+def _timestamp_to_date(timestamp: int) -> str:
+    """Convert the UNIX `timestamp` into the UTC date string YYYY-MM-DD."""
+
+    return _day_to_date(timestamp // SECONDS_PER_DAY)
+
+
 def new_bookmarks_by_date(metrics: Metrics) -> Dict[str, List[int]]:
     """Return a dictionary of the new bookmarks, indexed by their date-added
     timestamp (YYYY-MM-DD).
@@ -161,17 +234,15 @@ def new_bookmarks_by_date(metrics: Metrics) -> Dict[str, List[int]]:
     Returns:
         Dictionary mapping date strings to lists of bookmark IDs
     """
-    by_date: Dict[str, List[int]] = {}
+    by_date: defaultdict[str, List[int]] = defaultdict(list)
 
     for bookmark_id in sorted(metrics.bookmarks.added):
         # Convert the bookmark ID (which is a UNIX timestamp) into a date
         # string of the form "YYYY-MM-DD".
-        dt = datetime.fromtimestamp(bookmark_id, tz=timezone.utc)
-        date_str = dt.strftime('%Y-%m-%d')
+        by_date[_timestamp_to_date(bookmark_id)].append(bookmark_id)
 
-        by_date.setdefault(date_str, []).append(bookmark_id)
-
-    return by_date
+    # Hand back a plain dict, so that lookups of missing dates don't add keys.
+    return dict(by_date)
 
 
 def tags_usage_by_date(metrics: Metrics) -> Dict[str, Counter[str]]:
@@ -184,44 +255,38 @@ def tags_usage_by_date(metrics: Metrics) -> Dict[str, Counter[str]]:
     Returns:
         Dictionary mapping date strings to Counter objects of tag usage
     """
-    by_date: Dict[str, Counter[str]] = {}
+    by_date: defaultdict[str, Counter[str]] = defaultdict(Counter)
 
     for bookmark in metrics.bookmarks.new_bookmarks:
         # Convert the bookmark created timestamp into a date string
-        dt = datetime.fromtimestamp(bookmark.created, tz=timezone.utc)
-        date_str = dt.strftime('%Y-%m-%d')
-
-        if date_str not in by_date:
-            by_date[date_str] = Counter()
+        by_date[_timestamp_to_date(bookmark.created)].update(bookmark.tags)
 
-        for tag in bookmark.tags:
-            by_date[date_str][tag] += 1
+    # Hand back a plain dict, so that lookups of missing dates don't add keys.
+    return dict(by_date)
 
-    return by_date
 
-
-def all_bookmarks_sorted(data: Folder) -> List[Bookmark]:
-    """Create a list of all bookmarks in `data`, sorted by the creation time.
-    Uses an iterative BFS approach with efficient queue operations.
+def bookmarks_by_created(data: Folder) -> Dict[int, Bookmark]:
+    """Create a dictionary of all bookmarks in `data`, indexed by the creation
+    time (which serves as the bookmark ID). Should two bookmarks share a
+    creation time, the first one found in the (BFS) walk is kept.
 
     Args:
         data: Root folder to traverse
 
     Returns:
-        List of all bookmarks sorted by creation timestamp
+        Dictionary mapping creation timestamps to bookmarks
     """
-    bookmarks: List[Bookmark] = []
+    bookmarks: Dict[int, Bookmark] = {}
     queue: deque[Folder | Bookmark] = deque(data.content)
 
     while queue:
         item = queue.popleft()
 
         if isinstance(item, Bookmark):
-            bookmarks.append(item)
+            bookmarks.setdefault(item.created, item)
         elif isinstance(item, Folder):
             queue.extend(item.content)
 
-    bookmarks.sort(key=attrgetter('created'))
     return bookmarks
 
 
@@ -241,6 +306,9 @@ def _calculate_delta_metrics(
 
     Returns:
         Tuple of (delta, delta_pct, added, added_count, deleted, deleted_count)
+
+    For initial data the returned `added` is `current_items` itself rather
+    than a copy, so it must be treated as read-only.
     """
     delta = current_count - previous_count
 
@@ -249,12 +317,16 @@ def _calculate_delta_metrics(
     else:
         delta_pct = delta / previous_count
 
-    if previous_items is not None:
+    if previous_items is None:
+        added = current_items
+        deleted = set()
+    elif previous_items is current_items:
+        # Comparing a set against itself, nothing was added or deleted
+        added = set()
+        deleted = set()
+    else:
         added = current_items - previous_items
         deleted = previous_items - current_items
-    else:
-        added = current_items.copy()
-        deleted = set()
 
     return delta, delta_pct, added, len(added), deleted, len(deleted)
 
@@ -318,15 +390,12 @@ def _generate_aggregated_metrics(this_week: Folder, metrics: Metrics) -> None:
         this_week: Current week's folder data
         metrics: Metrics object to update with aggregated values
     """
-    # Bookmark objects for the new bookmarks
-    all_bookmarks = all_bookmarks_sorted(this_week)
-    metrics.bookmarks.new_bookmarks = []
-
-    for bookmark_id in sorted(metrics.bookmarks.added):
-        pos = bisect_left(
-            all_bookmarks, bookmark_id, key=attrgetter('created')
-        )
-        metrics.bookmarks.new_bookmarks.append(all_bookmarks[pos])
+    # Bookmark objects for the new bookmarks, looked up by their IDs
+    all_bookmarks = bookmarks_by_created(this_week)
+    metrics.bookmarks.new_bookmarks = [
+        all_bookmarks[bookmark_id]
+        for bookmark_id in sorted(metrics.bookmarks.added)
+    ]
 
     # New bookmarks by date
     metrics.bookmarks.new_bookmarks_by_date = new_bookmarks_by_date(metrics)
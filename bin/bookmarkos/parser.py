@@ -5,32 +5,79 @@ captures."""
 
 from collections import deque
 from io import StringIO, TextIOWrapper
+from itertools import islice
 from operator import attrgetter
 import re
-from typing import TextIO
+from typing import Iterable, TextIO
 
 from bookmarkos.data.bookmarks import Bookmark, Folder
-from bookmarkos.json_io import read_content
+from bookmarkos.json_io import read_lines
 
-# Pre-compiled regex patterns for performance
+# Pre-compiled regex patterns for performance. The `<DT>` and `<DD>` lines are
+# first checked with plain string operations, and the patterns are only used
+# for anything those don't recognize.
 DT_PATTERN = re.compile(r'^\s+<DT>(<(A|H3) .*>)$')
 DL_OPEN_PATTERN = re.compile(r'^\s+<DL><p>$')
 DD_PATTERN = re.compile(r'^\s+<DD>(.*)$')
 
+# The prefixes of the (unindented) `<DT>` lines, for the string-based check.
+DT_PREFIXES = ('<DT><A ', '<DT><H3 ')
+
 # Constants
 HEADER_LINES = 4
 ROOT_DL_TAG = '<DL><p>'
 MAX_NESTING_DEPTH = 100
 
 
+def _match_dt(line: str) -> tuple[str, str] | None:
+    """Match a `<DT>` line, returning the markup of the A or H3 tag that
+    follows the DT along with the tag name itself, or `None` if the line is
+    not recognized. The regular, indented form is handled without the regex."""
+
+    stripped = line.lstrip()
+    if (
+        len(stripped) < len(line) and stripped.startswith(DT_PREFIXES)
+        and stripped[-1] == '>' and '\n' not in line
+    ):
+        markup = stripped[4:]
+        return markup, 'A' if markup[1] == 'A' else 'H3'
+
+    if m := DT_PATTERN.fullmatch(line):
+        return m.group(1), m.group(2)
+
+    return None
+
+
+def _open_dl(markup: str, queue: deque[str], line_number: int) -> None:
+    """Consume the opening `<DL>` line that must follow the folder declared by
+    `markup`, raising `ValueError` if it is not there."""
+
+    if not queue:
+        raise ValueError(
+            f"Unexpected end of input after folder '{markup}'" +
+            f" at line {line_number}"
+        )
+
+    next_line = queue.popleft()
+    if not DL_OPEN_PATTERN.fullmatch(next_line):
+        # Better error recovery - put line back
+        queue.appendleft(next_line)
+        raise ValueError(
+            f"Missing opening <DL> after '{markup}' at line" +
+            f" {line_number}, found '{next_line}'"
+        )
+
+
 def process_dt(
         line: str,
         queue: deque[str],
         folder: Folder,
         parent: list[str],
-        line_number: int = 0
+        line_number: int = 0,
+        sort_children: bool = True
 ) -> None:
-    """Process a `<DT>` block."""
+    """Process a `<DT>` block. If it declares a folder, `sort_children` is
+    passed along to `process_folder` for it."""
 
     # Add recursion depth protection
     if len(parent) > MAX_NESTING_DEPTH:
@@ -40,45 +87,30 @@ def process_dt(
 
     # Look for either A or H3 following a DT. Preserve the specific tag and the
     # markup itself.
-    m = DT_PATTERN.fullmatch(line)
-    if m:
-        markup = m.group(1)
-        tag = m.group(2)
-
-        if tag == 'A':
-            # Bookmark. Simple.
-            bookmark = Bookmark().fill(markup)
-            bookmark.parent = parent.copy()
-            folder.content.append(bookmark)
-        elif tag == 'H3':
-            # Folder. First we have to ensure that the next line is the opening
-            # of a folder, then we process it recursively.
-            if not queue:
-                raise ValueError(
-                    f"Unexpected end of input after folder '{markup}'" +
-                    f" at line {line_number}"
-                )
+    dt = _match_dt(line)
+    if dt is None:
+        raise ValueError(
+            f"Unrecognized <DT> format at line {line_number}: '{line}'"
+        )
 
-            next_line = queue.popleft()
-            if DL_OPEN_PATTERN.fullmatch(next_line):
-                subfolder = process_folder(
-                    markup, queue, parent, line_number + 1
-                )
-                folder.content.append(subfolder)
-            else:
-                # Better error recovery - put line back
-                queue.appendleft(next_line)
-                raise ValueError(
-                    f"Missing opening <DL> after '{markup}' at line" +
-                    f" {line_number}, found '{next_line}'"
-                )
-        else:
-            raise ValueError(
-                f"Unknown tag type '{tag}' in <DT> at line {line_number}"
-            )
+    markup, tag = dt
+    if tag == 'A':
+        # Bookmark. Simple.
+        bookmark = Bookmark().fill(markup)
+        bookmark.parent = parent.copy()
+        folder.content.append(bookmark)
+    elif tag == 'H3':
+        # Folder. First we have to ensure that the next line is the opening of
+        # a folder, then we process it.
+        _open_dl(markup, queue, line_number)
+        subfolder = process_folder(
+            markup, queue, parent, line_number + 1,
+            sort_children=sort_children
+        )
+        folder.content.append(subfolder)
     else:
         raise ValueError(
-            f"Unrecognized <DT> format at line {line_number}: '{line}'"
+            f"Unknown tag type '{tag}' in <DT> at line {line_number}"
         )
 
 
@@ -92,10 +124,15 @@ def process_dd(line: str, folder: Folder, line_number: int = 0) -> None:
         )
 
     notes = None
-    # This RE only looks for all content following the DD, to the end of the
-    # line.
-    m = DD_PATTERN.fullmatch(line)
-    if m:
+    # Take all content following the DD, to the end of the line. The regular,
+    # indented form is sliced off directly, anything else goes to the RE.
+    stripped = line.lstrip()
+    if (
+        len(stripped) < len(line) and stripped.startswith('<DD>')
+        and '\n' not in line
+    ):
+        notes = stripped[4:]
+    elif m := DD_PATTERN.fullmatch(line):
         notes = m.group(1)
     else:
         raise ValueError(f'Malformed <DD> tag at line {line_number}: "{line}"')
@@ -111,42 +148,64 @@ def process_dd(line: str, folder: Folder, line_number: int = 0) -> None:
         )
 
 
-def process_folder(
-        text: str,
-        queue: deque[str],
-        path: list[str],
-        line_number: int = 0
-) -> Folder:
-    """Handle the parsing and conversion of one folder. Called after the
-    opening `<DL>` tag has been detected and proceeds until the closing tag
-    is detected. Recurses into any sub-folders found."""
+def _new_folder(
+        text: str, path: list[str], line_number: int
+) -> tuple[Folder, str, list[str]]:
+    """Create the `Folder` declared by `text` at `path`. Returns it along with
+    the end marker that closes it and the path for its own content."""
 
     depth = len(path)
-    # Add recursion depth protection
-    if len(path) > MAX_NESTING_DEPTH:
+    # Depth protection, against runaway nesting in malformed input
+    if depth > MAX_NESTING_DEPTH:
         raise ValueError(
             f"Maximum folder nesting depth exceeded at line {line_number}"
         )
 
     # Start with a fresh `Folder` instance, filled in with the content passed
-    # as `text`. The `depth` parameter is used to create the marker we will
-    # look for as signaling the end of the folder.
+    # as `text`. The `depth` is used to create the marker we will look for as
+    # signaling the end of the folder.
     folder = Folder().fill(text)
     folder.depth = depth
     folder.parent = path.copy()
-    padding = '    ' * depth
-    end_marker = f'{padding}</DL><p>'
-    parent = path + [folder.name]
 
-    current_line_number = line_number
-    line = None
+    return folder, f'{"    " * depth}</DL><p>', path + [folder.name]
+
 
+def process_folder(
+        text: str,
+        queue: deque[str],
+        path: list[str],
+        line_number: int = 0,
+        sort_children: bool = True
+) -> Folder:
+    """Handle the parsing and conversion of one folder. Called after the
+    opening `<DL>` tag has been detected and proceeds until the closing tag
+    is detected. Sub-folders are handled within the same loop, by keeping a
+    stack of the folders that are still open rather than by recursion. The
+    content of each folder is sorted by name, unless `sort_children` is
+    cleared."""
+
+    root, end_marker, parent = _new_folder(text, path, line_number)
+    folder = root
+    stack: list[tuple[Folder, str, list[str]]] = [(root, end_marker, parent)]
+
+    current_line_number = line_number
     while queue:
         current_line_number += 1
         line = queue.popleft()
 
         if line == end_marker:
-            break
+            # Sorting by name isn't really necessary, but it makes the data
+            # easier to test/triage. Callers that don't need it can clear
+            # `sort_children` to leave the content in the order of the input.
+            if sort_children:
+                folder.content.sort(key=attrgetter('name'))
+            stack.pop()
+            if not stack:
+                return root
+
+            folder, end_marker, parent = stack[-1]
+            continue
 
         # Log empty lines for debugging but continue
         if not line:
@@ -157,7 +216,25 @@ def process_folder(
         # see DT and DD tags.
         try:
             if '<DT>' in line:
-                process_dt(line, queue, folder, parent, current_line_number)
+                # Sub-folders are opened here, bookmarks (and anything that
+                # doesn't match) are left to `process_dt`.
+                dt = _match_dt(line) if '<H3' in line else None
+                if dt is not None and dt[1] == 'H3':
+                    markup = dt[0]
+                    _open_dl(markup, queue, current_line_number)
+                    current_line_number += 1
+
+                    subfolder, end_marker, parent = _new_folder(
+                        markup, parent, current_line_number
+                    )
+                    folder.content.append(subfolder)
+                    folder = subfolder
+                    stack.append((folder, end_marker, parent))
+                else:
+                    process_dt(
+                        line, queue, folder, parent, current_line_number,
+                        sort_children=sort_children
+                    )
             elif '<DD>' in line:
                 process_dd(line, folder, current_line_number)
             else:
@@ -170,50 +247,64 @@ def process_folder(
                 f'Error processing "{folder.name}" at depth {len(parent)}: {e}'
             ) from e
 
-        line = None
-
     # This means we ran out of lines before closing the folder.
-    if line is None:
+    raise ValueError(
+        f'Closing <DL> for folder "{folder.name}" not found'
+    )
+
+
+def parse_bookmarks_from_lines(
+        lines: Iterable[str],
+        sort_children: bool = True
+) -> Folder:
+    """Process the lines of a bookmarks backup, without their newlines, into
+    a `Folder` object that represents the full tree. The content of each
+    folder is sorted by name, unless `sort_children` is cleared."""
+
+    lines = iter(lines)
+
+    # Take the first 4 lines of content (not used for anything) and the
+    # opening <DL> of the root folder.
+    header = list(islice(lines, HEADER_LINES + 1))
+    if len(header) < HEADER_LINES + 1:
+        raise ValueError(
+            f'Expected at least {HEADER_LINES + 1} lines, got {len(header)}'
+        )
+
+    if header[-1] != ROOT_DL_TAG:
         raise ValueError(
-            f'Closing <DL> for folder "{folder.name}" not found'
+            f'Missing expected opening <DL>, found: "{header[-1]}"'
         )
 
-    # Sorting by name isn't really necessary, but it makes the data easier to
-    # test/triage.
-    folder.content.sort(key=attrgetter('name'))
-    return folder
+    # The remaining lines go into a deque for efficient operations
+    line_queue = deque(lines)
+
+    return process_folder(
+        '', line_queue, [], HEADER_LINES + 1, sort_children=sort_children
+    )
 
 
-def parse_bookmarks(content: str | TextIO | TextIOWrapper | StringIO) -> Folder:
+def parse_bookmarks(
+        content: str | TextIO | TextIOWrapper | StringIO,
+        sort_children: bool = True
+) -> Folder:
     """Process the input in `content` into a `Folder` object that represents
-    the full tree."""
+    the full tree. The content of each folder is sorted by name, unless
+    `sort_children` is cleared."""
 
-    data = []
     # Three types of value for `content` are accepted: an open FH, a string
     # that starts with a DOCTYPE declaration, or a string that represents a
-    # file name.
-    if isinstance(content, (TextIO, TextIOWrapper, StringIO)):
-        data = content.read().split("\n")
+    # file name. An open FH or a named file is streamed line-by-line rather
+    # than read whole and then split, so the full text and the list of its
+    # lines are never held at the same time. `TextIO` is only a typing alias
+    # that no real handle is an instance of, so handles are recognized by
+    # having a `read` method.
+    lines: Iterable[str]
+    if hasattr(content, 'read'):
+        lines = (line.rstrip('\n') for line in content)
     elif isinstance(content, str) and content.startswith('<!DOCTYPE'):
-        data = content.split("\n")
+        lines = content.split("\n")
     else:
-        data = read_content(content).split("\n")
-
-    # Validate minimum content length
-    if len(data) < HEADER_LINES + 1:
-        raise ValueError(
-            f'Expected at least {HEADER_LINES + 1} lines, got {len(data)}'
-        )
-
-    # Drop the first 4 lines of content, not used for anything.
-    lines = data[HEADER_LINES:]
-    if not lines or lines[0] != ROOT_DL_TAG:
-        actual = lines[0] if lines else "EOF"
-        raise ValueError(f'Missing expected opening <DL>, found: "{actual}"')
-
-    lines.pop(0)
-
-    # Convert to deque for efficient operations
-    line_queue = deque(lines)
+        lines = read_lines(content)
 
-    return process_folder('', line_queue, [], HEADER_LINES + 1)
+    return parse_bookmarks_from_lines(lines, sort_children=sort_children)
@@ -22,7 +22,7 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bookmark_html() -> str:
     """Sample BookmarkOS HTML content for testing."""
     return '''<!DOCTYPE NETSCAPE-Bookmark-file-1>
@@ -57,7 +57,7 @@ def sample_bookmark_html() -> str:
 </DL><p>'''
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def malformed_bookmark_html() -> str:
     """Sample malformed BookmarkOS HTML for testing error handling."""
     return '''<!DOCTYPE NETSCAPE-Bookmark-file-1>
@@ -40,6 +40,11 @@ class TestNode:
 
         assert node.parent == ["new_folder"]
 
+    def test_node_classes_use_slots(self):
+        """Test that the node classes do not carry a per-instance __dict__."""
+        for node in (Node(), Folder(), Bookmark()):
+            assert not hasattr(node, '__dict__')
+
 
 class TestFolder:
     """Tests for the Folder class."""
@@ -181,7 +186,7 @@ class TestBookmark:
         assert bookmark.created == 1641921698
         assert bookmark.updated == 1641921698
         assert bookmark.visited is None
-        assert bookmark.tags == [""]  # Empty TAGS attr splits to [""]
+        assert bookmark.tags == []  # No TAGS attr means no tags
 
     def test_bookmark_fill_with_visit_and_tags(self):
         """Test fill method with visit time and tags."""
@@ -204,7 +209,7 @@ class TestBookmark:
 
         bookmark.fill(markup)
 
-        assert bookmark.tags == [""]  # Empty string splits to [""]
+        assert bookmark.tags == []  # Empty TAGS attr means no tags
 
     def test_bookmark_fill_single_tag(self):
         """Test fill method with single tag."""
@@ -225,6 +230,14 @@ class TestBookmark:
 
         assert bookmark.tags == ["python programming", "web development"]
 
+    def test_bookmark_fill_interns_tags(self):
+        """Test that the same tag on two bookmarks is one shared string."""
+        first = Bookmark().fill('<A HREF="https://a.com" ADD_DATE="1" LAST_MODIFIED="1" TAGS="python, web">A</A>')
+        second = Bookmark().fill('<A HREF="https://b.com" ADD_DATE="2" LAST_MODIFIED="2" TAGS="web, python">B</A>')
+
+        assert first.tags[0] is second.tags[1]
+        assert first.tags[1] is second.tags[0]
+
 
 class TestParseFragment:
     """Tests for the parse_fragment function."""
@@ -358,3 +371,17 @@ class TestParseFragment:
             'ADD_DATE': '123',
             'HREF': 'https://example.com'
         }
+
+    @pytest.mark.parser
+    def test_parse_irregular_markup(self):
+        """Test markup with tab separators and prefixed attribute names."""
+        content = '<A\tHREF="https://example.com"\tADD_DATE="123" x-TAGS="a">Tabbed</A>'
+
+        text, attrib = parse_fragment(content)
+
+        assert text == "Tabbed"
+        assert attrib == {
+            'HREF': 'https://example.com',
+            'ADD_DATE': '123',
+            'TAGS': 'a'
+        }
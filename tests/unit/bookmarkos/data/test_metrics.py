@@ -3,7 +3,7 @@
 """Unit tests for bookmarkos.data.metrics module."""
 
 from collections import Counter
-from unittest.mock import Mock
+from bookmarkos.data.bookmarks import Bookmark  # pyright: ignore[reportMissingImports]
 from bookmarkos.data.metrics import (  # pyright: ignore[reportMissingImports]
     CoreMetrics, SizeMetrics, FoldersMetrics,
     BookmarksMetrics, TagsMetrics, Metrics, SizeRankedList
@@ -204,11 +204,8 @@ class TestBookmarksMetrics:
         """Test new_bookmarks list operations."""
         metrics = BookmarksMetrics()
 
-        # Mock bookmark objects
-        bookmark1 = Mock()
-        bookmark1.name = "Bookmark 1"
-        bookmark2 = Mock()
-        bookmark2.name = "Bookmark 2"
+        bookmark1 = Bookmark(name="Bookmark 1")
+        bookmark2 = Bookmark(name="Bookmark 2")
 
         metrics.new_bookmarks.append(bookmark1)
         metrics.new_bookmarks.append(bookmark2)
@@ -286,10 +283,10 @@ class TestTagsMetrics:
         metrics.tags_by_date["2022-01-01"] = Counter({"python": 3, "web": 2})
         metrics.tags_by_date["2022-01-02"] = Counter({"python": 1, "api": 2})
 
-        assert metrics.tags_by_date["2022-01-01"]["python"] == 3
-        assert metrics.tags_by_date["2022-01-01"]["web"] == 2
-        assert metrics.tags_by_date["2022-01-02"]["python"] == 1
-        assert metrics.tags_by_date["2022-01-02"]["api"] == 2
+        assert metrics.tags_by_date["2022-01-01"] == Counter(
+            {"python": 3, "web": 2})
+        assert metrics.tags_by_date["2022-01-02"] == Counter(
+            {"python": 1, "api": 2})
 
     def test_unique_tags_vs_total_count(self):
         """Test relationship between unique_tags_count and total count."""
@@ -5,10 +5,12 @@
 import gzip
 import json
 from io import StringIO
+from tempfile import SpooledTemporaryFile
 from unittest.mock import Mock, patch
+from bookmarkos.data.bookmarks import Bookmark  # pyright: ignore[reportMissingImports]
 from bookmarkos.json_io import (  # pyright: ignore[reportMissingImports]
-    BasicEncoder, BookmarksDecoder, read_content, read_plain_json,
-    read_bookmarks_json, write_json_data
+    BasicEncoder, BookmarksDecoder, read_content, read_lines, read_raw_content,
+    read_plain_json, read_bookmarks_json, write_json_data
 )
 
 import pytest  # pyright: ignore[reportMissingImports]
@@ -40,6 +42,15 @@ class TestBasicEncoder:
         assert result == []
         assert isinstance(result, list)
 
+    @pytest.mark.io
+    def test_basic_encoder_handles_frozensets(self):
+        """Test that BasicEncoder converts frozensets to sorted lists."""
+        encoder = BasicEncoder()
+
+        result = encoder.default(frozenset({'b', 'c', 'a'}))
+
+        assert result == ['a', 'b', 'c']
+
     @pytest.mark.io
     def test_basic_encoder_handles_objects_with_dict(self):
         """Test that BasicEncoder converts objects to their __dict__."""
@@ -55,6 +66,25 @@ class TestBasicEncoder:
 
         assert result == {"name": "test", "value": 42}
 
+    @pytest.mark.io
+    def test_basic_encoder_handles_slotted_dataclasses(self):
+        """Test that BasicEncoder converts dataclasses without a __dict__."""
+        encoder = BasicEncoder()
+        bookmark = Bookmark(name="test", url="https://example.com")
+
+        result = encoder.default(bookmark)
+
+        assert result == {
+            "name": "test",
+            "created": 0,
+            "updated": 0,
+            "parent": [],
+            "url": "https://example.com",
+            "visited": None,
+            "tags": [],
+            "notes": None
+        }
+
     @pytest.mark.io
     def test_basic_encoder_full_json_encoding(self):
         """Test full JSON encoding with sets and objects."""
@@ -200,6 +230,17 @@ class TestReadContent:
 
         assert result == content
 
+    @pytest.mark.io
+    def test_read_content_from_other_file_like(self):
+        """Test reading content from a handle that isn't a TextIOWrapper."""
+        with SpooledTemporaryFile(mode='w+') as file_handle:
+            file_handle.write("Test file content")
+            file_handle.seek(0)
+
+            result = read_content(file_handle)
+
+        assert result == "Test file content"
+
     @pytest.mark.io
     def test_read_content_from_plain_file(self, temp_dir):
         """Test reading content from a plain text file."""
@@ -217,13 +258,24 @@ class TestReadContent:
         content = "Compressed test content\nLine 2"
         test_file = temp_dir / "test.txt.gz"
 
-        with gzip.open(test_file, 'wt', encoding='utf-8') as f:
-            f.write(content)
+        test_file.write_bytes(gzip.compress(content.encode('utf-8')))
 
         result = read_content(str(test_file))
 
         assert result == content
 
+    @pytest.mark.io
+    def test_read_content_from_gzip_file_as_utf8(self, temp_dir):
+        """Test that gzip'd text is decoded as UTF-8, not the locale."""
+        test_file = temp_dir / "test.txt.gz"
+        test_file.write_bytes(gzip.compress("café".encode('utf-8')))
+
+        with patch('bookmarkos.json_io.GZ.open', wraps=gzip.open) as mock_open:
+            result = read_content(str(test_file))
+
+        assert result == "café"
+        assert mock_open.call_args.kwargs['encoding'] == 'utf8'
+
     @pytest.mark.io
     def test_read_content_auto_detects_compression(self, temp_dir):
         """Test that read_content auto-detects compression by extension."""
@@ -234,8 +286,7 @@ class TestReadContent:
         gzip_file = temp_dir / "compressed.txt.gz"
 
         plain_file.write_text(plain_content, encoding='utf-8')
-        with gzip.open(gzip_file, 'wt', encoding='utf-8') as f:
-            f.write(gzip_content)
+        gzip_file.write_bytes(gzip.compress(gzip_content.encode('utf-8')))
 
         plain_result = read_content(str(plain_file))
         gzip_result = read_content(str(gzip_file))
@@ -255,6 +306,123 @@ class TestReadContent:
         assert result == content
 
 
+class TestReadLines:
+    """Tests for the read_lines function."""
+
+    @pytest.mark.io
+    def test_read_lines_from_file_handle(self):
+        """Test reading lines from an open file handle."""
+        file_handle = StringIO("Line 1\nLine 2\n")
+
+        result = list(read_lines(file_handle))
+
+        assert result == ["Line 1", "Line 2"]
+        assert not file_handle.closed
+
+    @pytest.mark.io
+    def test_read_lines_from_other_file_like(self):
+        """Test reading lines from a handle that isn't a TextIOWrapper."""
+        with SpooledTemporaryFile(mode='w+') as file_handle:
+            file_handle.write("Line 1\nLine 2\n")
+            file_handle.seek(0)
+
+            result = list(read_lines(file_handle))
+
+        assert result == ["Line 1", "Line 2"]
+
+    @pytest.mark.io
+    def test_read_lines_from_plain_file(self, temp_dir):
+        """Test reading lines from a plain text file."""
+        content = "Unicode content: café\nLine 2"
+        test_file = temp_dir / "test.txt"
+        test_file.write_text(content, encoding='utf-8')
+
+        result = list(read_lines(str(test_file)))
+
+        assert result == ["Unicode content: café", "Line 2"]
+
+    @pytest.mark.io
+    def test_read_lines_from_gzip_file(self, temp_dir):
+        """Test reading lines from a gzip compressed file."""
+        test_file = temp_dir / "test.txt.gz"
+
+        test_file.write_bytes(gzip.compress(b"Compressed test content\nLine 2\n"))
+
+        result = list(read_lines(str(test_file)))
+
+        assert result == ["Compressed test content", "Line 2"]
+
+    @pytest.mark.io
+    def test_read_lines_missing_file(self, temp_dir):
+        """Test that a missing file raises FileNotFoundError on the call."""
+        with pytest.raises(FileNotFoundError, match="was not found"):
+            read_lines(str(temp_dir / "missing.html"))
+
+    @pytest.mark.io
+    def test_read_lines_invalid_file_type(self):
+        """Test that a non-string, non-handle value raises ValueError."""
+        with pytest.raises(ValueError, match="must be a string path"):
+            read_lines(42)
+
+    @pytest.mark.io
+    def test_read_lines_empty_path(self):
+        """Test that an empty path raises ValueError on the call."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            read_lines("")
+
+    @pytest.mark.io
+    def test_read_lines_corrupt_gzip_file(self, temp_dir):
+        """Test that a read error is reported against the file name."""
+        test_file = temp_dir / "test.txt.gz"
+        test_file.write_bytes(b"not gzip data")
+
+        lines = read_lines(str(test_file))
+
+        with pytest.raises(OSError, match="I/O error when reading"):
+            list(lines)
+
+
+class TestReadRawContent:
+    """Tests for the read_raw_content function."""
+
+    @pytest.mark.io
+    def test_read_raw_content_from_file_handle(self):
+        """Test that an open file handle is read as text."""
+        file_handle = StringIO("Test file content")
+
+        result = read_raw_content(file_handle)
+
+        assert result == "Test file content"
+
+    @pytest.mark.io
+    def test_read_raw_content_from_plain_file(self, temp_dir):
+        """Test that a plain file is read as undecoded bytes."""
+        content = "Unicode content: café\r\nLine 2"
+        test_file = temp_dir / "test.txt"
+        test_file.write_bytes(content.encode('utf-8'))
+
+        result = read_raw_content(str(test_file))
+
+        assert result == content.encode('utf-8')
+
+    @pytest.mark.io
+    def test_read_raw_content_from_gzip_file(self, temp_dir):
+        """Test that a gzip compressed file is read as decompressed bytes."""
+        content = b"Compressed test content\nLine 2"
+        test_file = temp_dir / "test.txt.gz"
+        test_file.write_bytes(gzip.compress(content))
+
+        result = read_raw_content(str(test_file))
+
+        assert result == content
+
+    @pytest.mark.io
+    def test_read_raw_content_missing_file(self, temp_dir):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="was not found"):
+            read_raw_content(str(temp_dir / "missing.json"))
+
+
 class TestReadPlainJson:
     """Tests for the read_plain_json function."""
 
@@ -277,8 +445,7 @@ class TestReadPlainJson:
         data = {"compressed": True, "values": [1, 2, 3]}
         test_file = temp_dir / "test.json.gz"
 
-        with gzip.open(test_file, 'wt', encoding='utf-8') as f:
-            json.dump(data, f)
+        test_file.write_bytes(gzip.compress(json.dumps(data).encode('utf-8')))
 
         result = read_plain_json(str(test_file))
 
@@ -386,20 +553,46 @@ class TestWriteJsonData:
         assert result == data
 
     @pytest.mark.io
-    def test_write_json_data_with_custom_json_args(self, temp_dir):
+    def test_write_json_data_to_other_file_like(self):
+        """Test writing JSON data to a handle that isn't a TextIOWrapper."""
+        data = {"target": "spooled_file"}
+
+        with SpooledTemporaryFile(mode='w+') as file_handle:
+            write_json_data(data, file_handle)
+            file_handle.seek(0)
+
+            result = json.load(file_handle)
+
+        assert result == data
+
+    @pytest.mark.io
+    def test_write_json_data_with_custom_json_args(self):
         """Test writing JSON with custom JSON arguments."""
         data = {"name": "test", "value": 42}
-        test_file = temp_dir / "formatted.json"
+        file_handle = StringIO()
 
-        write_json_data(data, str(test_file), json={
+        write_json_data(data, file_handle, json={
                         "indent": 2, "sort_keys": True})
 
         # Verify formatting
-        content = test_file.read_text(encoding='utf-8')
+        content = file_handle.getvalue()
         assert "  " in content  # Should be indented
         assert content.index('"name"') < content.index(
             '"value"')  # Should be sorted
 
+    @pytest.mark.io
+    def test_write_json_data_is_compact_by_default(self):
+        """Test that output uses compact separators unless indenting."""
+        data = {"name": "test", "values": [1, 2]}
+        compact = StringIO()
+        pretty = StringIO()
+
+        write_json_data(data, compact)
+        write_json_data(data, pretty, json={"indent": 2})
+
+        assert compact.getvalue() == '{"name":"test","values":[1,2]}'
+        assert '"name": "test"' in pretty.getvalue()
+
     @pytest.mark.io
     def test_write_json_data_with_custom_gzip_args(self, temp_dir):
         """Test writing compressed JSON with custom gzip arguments."""
@@ -415,20 +608,30 @@ class TestWriteJsonData:
         assert result == data
 
     @pytest.mark.io
-    def test_write_json_data_uses_basic_encoder(self, temp_dir):
+    def test_write_json_data_default_compresslevel(self, temp_dir):
+        """Test that compressed output defaults to level 6, not 9."""
+        test_file = temp_dir / "default_level.json.gz"
+
+        write_json_data({"level": "default"}, str(test_file))
+
+        # The gzip header's XFL byte is 2 for level 9, 4 for level 1 and 0
+        # for everything in between.
+        assert test_file.read_bytes()[8] == 0
+
+    @pytest.mark.io
+    def test_write_json_data_uses_basic_encoder(self):
         """Test that write_json_data uses BasicEncoder for sets."""
         data = {
             "name": "test",
             "tags": {"python", "testing", "json"},
             "numbers": {1, 2, 3}
         }
-        test_file = temp_dir / "with_sets.json"
+        file_handle = StringIO()
 
-        write_json_data(data, str(test_file))
+        write_json_data(data, file_handle)
 
         # Read back and verify sets were converted to sorted lists
-        with open(test_file, 'r', encoding='utf-8') as f:
-            result = json.load(f)
+        result = json.loads(file_handle.getvalue())
 
         assert isinstance(result["tags"], list)
         assert sorted(result["tags"]) == result["tags"]  # Should be sorted
@@ -451,6 +654,24 @@ class TestWriteJsonData:
         assert "café" in result["message"]
         assert "中文" in result["message"]
 
+    @pytest.mark.io
+    def test_write_json_data_invalid_file_type(self):
+        """Test that a bad file argument is reported before any encoding."""
+        # The data can't be encoded, so a TypeError here would mean that the
+        # encoding was attempted first.
+        data = {"unencodable": object()}
+
+        with pytest.raises(ValueError, match="must be a string path"):
+            write_json_data(data, 123)
+
+    @pytest.mark.io
+    def test_write_json_data_empty_path(self):
+        """Test that an empty path is reported before any encoding."""
+        data = {"unencodable": object()}
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            write_json_data(data, "  ")
+
 
 class TestJsonIoIntegration:
     """Integration tests for JSON I/O operations."""
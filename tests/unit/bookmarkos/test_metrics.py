@@ -7,10 +7,11 @@ from unittest.mock import Mock, patch
 
 import pytest  # pyright: ignore[reportMissingImports]
 
+from bookmarkos.data.bookmarks import Bookmark, Folder  # pyright: ignore[reportMissingImports]
 from bookmarkos.metrics import (  # pyright: ignore[reportMissingImports]
     get_largest_and_smallest, average_size, new_bookmarks_by_date,
-    tags_usage_by_date, all_bookmarks_sorted, differentiate_metrics,
-    gather_metrics
+    tags_usage_by_date, bookmarks_by_created,
+    differentiate_metrics, gather_metrics
 )
 
 
@@ -183,6 +184,19 @@ class TestNewBookmarksByDate:
         # Should be sorted within the day
         assert result["2022-01-12"] == [1641945600, 1641945700]
 
+    @pytest.mark.metrics
+    def test_new_bookmarks_by_date_utc_day_boundary(self):
+        """Test that the date changes exactly at midnight UTC."""
+        mock_metrics = Mock()
+        mock_metrics.bookmarks.added = {
+            1641945599,  # 2022-01-11 23:59:59 UTC
+            1641945600,  # 2022-01-12 00:00:00 UTC
+        }
+
+        result = new_bookmarks_by_date(mock_metrics)
+
+        assert result == {"2022-01-11": [1641945599], "2022-01-12": [1641945600]}
+
 
 class TestTagsUsageByDate:
     """Tests for the tags_usage_by_date function."""
@@ -248,97 +262,38 @@ class TestTagsUsageByDate:
         assert len(result["2022-01-11"]) == 0  # Empty Counter
 
 
-class TestAllBookmarksSorted:
-    """Tests for the all_bookmarks_sorted function."""
-
-    @pytest.mark.metrics
-    def test_all_bookmarks_sorted_basic(self):
-        """Test basic bookmark collection and sorting."""
-        # Create mock bookmarks with different creation times
-        bookmark1 = Mock()
-        bookmark1.created = 1641945600
-
-        bookmark2 = Mock()
-        bookmark2.created = 1641859200  # Earlier
-
-        bookmark3 = Mock()
-        bookmark3.created = 1642032000  # Latest
-
-        # Create mock folder structure
-        subfolder = Mock()
-        subfolder.content = [bookmark3]
-
-        root_folder = Mock()
-        root_folder.content = [bookmark1, bookmark2, subfolder]
-
-        with patch('bookmarkos.metrics.isinstance') as mock_isinstance:
-            # Configure isinstance to identify bookmarks vs folders
-            def isinstance_side_effect(obj, cls):
-                if cls.__name__ == 'Bookmark':
-                    return obj in [bookmark1, bookmark2, bookmark3]
-                elif cls.__name__ == 'Folder':
-                    return obj == subfolder
-                return False
-
-            mock_isinstance.side_effect = isinstance_side_effect
-
-            result = all_bookmarks_sorted(root_folder)
-
-            # Should return bookmarks sorted by creation time
-            assert len(result) == 3
-            assert result[0] == bookmark2  # Earliest (1641859200)
-            assert result[1] == bookmark1  # Middle (1641945600)
-            assert result[2] == bookmark3  # Latest (1642032000)
+class TestBookmarksByCreated:
+    """Tests for the bookmarks_by_created function."""
 
     @pytest.mark.metrics
-    def test_all_bookmarks_sorted_empty_folder(self):
-        """Test with empty folder."""
-        root_folder = Mock()
-        root_folder.content = []
-
-        result = all_bookmarks_sorted(root_folder)
-
-        assert result == []
+    def test_bookmarks_by_created_nested_structure(self):
+        """Test that bookmarks at all depths are indexed by creation time."""
+        bookmark1 = Bookmark(name="b1", created=100)
+        bookmark2 = Bookmark(name="b2", created=200)
+        bookmark3 = Bookmark(name="b3", created=50)
+        root_folder = Folder(content=[
+            bookmark1,
+            Folder(name="mid", content=[
+                bookmark2, Folder(name="deep", content=[bookmark3])
+            ]),
+        ])
+
+        result = bookmarks_by_created(root_folder)
+
+        assert result == {100: bookmark1, 200: bookmark2, 50: bookmark3}
 
     @pytest.mark.metrics
-    def test_all_bookmarks_sorted_nested_structure(self):
-        """Test with deeply nested folder structure."""
-        bookmark1 = Mock()
-        bookmark1.created = 100
-
-        bookmark2 = Mock()
-        bookmark2.created = 200
-
-        bookmark3 = Mock()
-        bookmark3.created = 50
-
-        # Deep nesting: root -> folder1 -> folder2 -> bookmark3
-        deep_folder = Mock()
-        deep_folder.content = [bookmark3]
+    def test_bookmarks_by_created_keeps_first_duplicate(self):
+        """Test that the first bookmark found wins on a shared timestamp."""
+        first = Bookmark(name="first", created=100)
+        second = Bookmark(name="second", created=100)
+        root_folder = Folder(content=[
+            first, Folder(name="sub", content=[second])
+        ])
 
-        mid_folder = Mock()
-        mid_folder.content = [bookmark2, deep_folder]
+        result = bookmarks_by_created(root_folder)
 
-        root_folder = Mock()
-        root_folder.content = [bookmark1, mid_folder]
-
-        with patch('bookmarkos.metrics.isinstance') as mock_isinstance:
-            def isinstance_side_effect(obj, cls):
-                if cls.__name__ == 'Bookmark':
-                    return obj in [bookmark1, bookmark2, bookmark3]
-                elif cls.__name__ == 'Folder':
-                    return obj in [mid_folder, deep_folder]
-                return False
-
-            mock_isinstance.side_effect = isinstance_side_effect
-
-            result = all_bookmarks_sorted(root_folder)
-
-            # Should collect all bookmarks and sort by creation time
-            assert len(result) == 3
-            assert result[0] == bookmark3  # created: 50
-            assert result[1] == bookmark1  # created: 100
-            assert result[2] == bookmark2  # created: 200
+        assert result[100] is first
 
 
 class TestDifferentiateMetrics:
@@ -377,15 +332,15 @@ class TestDifferentiateMetrics:
         mock_those.tags = Mock()
         mock_those.tags.items = {"python", "web"}
 
-        # Mock all_bookmarks_sorted to return bookmark objects for IDs 4 and 5
+        # Mock bookmarks_by_created to return bookmark objects for IDs 4 and 5
         mock_bookmark_4 = Mock()
         mock_bookmark_4.created = 1640995200  # 2022-01-01 timestamp
         mock_bookmark_5 = Mock()
         mock_bookmark_5.created = 1641081600  # 2022-01-02 timestamp
 
-        with patch('bookmarkos.metrics.all_bookmarks_sorted') as mock_sorted:
-            # Return bookmarks sorted by creation time
-            mock_sorted.return_value = [mock_bookmark_4, mock_bookmark_5]
+        with patch('bookmarkos.metrics.bookmarks_by_created') as mock_by_id:
+            # Return bookmarks indexed by their IDs
+            mock_by_id.return_value = {4: mock_bookmark_4, 5: mock_bookmark_5}
 
             with patch('bookmarkos.metrics.new_bookmarks_by_date') as mock_by_date, \
                     patch('bookmarkos.metrics.tags_usage_by_date') as mock_tags_by_date:
@@ -398,6 +353,8 @@ class TestDifferentiateMetrics:
             assert mock_these.bookmarks.delta == 10  # 150 - 140
         assert mock_these.bookmarks.delta_pct == pytest.approx(10/140)
         assert mock_these.bookmarks.added == {4, 5}
+        assert mock_these.bookmarks.new_bookmarks == [
+            mock_bookmark_4, mock_bookmark_5]
         assert mock_these.bookmarks.added_count == 2
         assert mock_these.bookmarks.deleted == set()
         assert mock_these.bookmarks.deleted_count == 0
@@ -418,7 +375,7 @@ class TestDifferentiateMetrics:
     def test_differentiate_metrics_initial_data(self):
         """Test differentiate_metrics with no previous data (initial state)."""
         mock_this_week = Mock()
-        mock_this_week.content = []  # Need proper content for all_bookmarks_sorted
+        mock_this_week.content = []  # Need proper content for bookmarks_by_created
 
         mock_these = Mock()
         mock_these.bookmarks = Mock()
@@ -432,7 +389,7 @@ class TestDifferentiateMetrics:
         mock_these.tags = Mock()
         mock_these.tags.items = {"python", "web"}
 
-        # Mock all_bookmarks_sorted to return bookmark objects for IDs 1, 2, 3
+        # Mock bookmarks_by_created to return bookmark objects for IDs 1, 2, 3
         mock_bookmark_1 = Mock()
         mock_bookmark_1.created = 1640995200  # 2022-01-01 timestamp
         mock_bookmark_2 = Mock()
@@ -440,10 +397,10 @@ class TestDifferentiateMetrics:
         mock_bookmark_3 = Mock()
         mock_bookmark_3.created = 1641168000  # 2022-01-03 timestamp
 
-        with patch('bookmarkos.metrics.all_bookmarks_sorted') as mock_sorted:
-            # Return bookmarks sorted by creation time
-            mock_sorted.return_value = [
-                mock_bookmark_1, mock_bookmark_2, mock_bookmark_3]
+        with patch('bookmarkos.metrics.bookmarks_by_created') as mock_by_id:
+            # Return bookmarks indexed by their IDs
+            mock_by_id.return_value = {
+                1: mock_bookmark_1, 2: mock_bookmark_2, 3: mock_bookmark_3}
 
             with patch('bookmarkos.metrics.new_bookmarks_by_date') as mock_by_date, \
                     patch('bookmarkos.metrics.tags_usage_by_date') as mock_tags_by_date:
@@ -470,7 +427,7 @@ class TestDifferentiateMetrics:
     def test_differentiate_metrics_zero_division_handling(self):
         """Test handling of division by zero in delta calculations."""
         mock_this_week = Mock()
-        mock_this_week.content = []  # Need proper content for all_bookmarks_sorted
+        mock_this_week.content = []  # Need proper content for bookmarks_by_created
 
         mock_these = Mock()
         mock_these.bookmarks = Mock()
@@ -497,15 +454,15 @@ class TestDifferentiateMetrics:
         mock_those.tags = Mock()
         mock_those.tags.items = set()
 
-        # Mock all_bookmarks_sorted to return bookmark objects for IDs 1, 2
+        # Mock bookmarks_by_created to return bookmark objects for IDs 1, 2
         mock_bookmark_1 = Mock()
         mock_bookmark_1.created = 1640995200  # 2022-01-01 timestamp
         mock_bookmark_2 = Mock()
         mock_bookmark_2.created = 1641081600  # 2022-01-02 timestamp
 
-        with patch('bookmarkos.metrics.all_bookmarks_sorted') as mock_sorted:
-            # Return bookmarks sorted by creation time
-            mock_sorted.return_value = [mock_bookmark_1, mock_bookmark_2]
+        with patch('bookmarkos.metrics.bookmarks_by_created') as mock_by_id:
+            # Return bookmarks indexed by their IDs
+            mock_by_id.return_value = {1: mock_bookmark_1, 2: mock_bookmark_2}
 
             with patch('bookmarkos.metrics.new_bookmarks_by_date') as mock_by_date, \
                     patch('bookmarkos.metrics.tags_usage_by_date') as mock_tags_by_date:
@@ -520,6 +477,25 @@ class TestDifferentiateMetrics:
         assert mock_these.folders.delta_pct == pytest.approx(-1.0)
         assert mock_these.tags.delta_pct == 0.0  # Both zero
 
+    @pytest.mark.metrics
+    def test_differentiate_metrics_against_itself(self):
+        """Test that comparing metrics against themselves shows no changes."""
+        week = Folder(content=[
+            Bookmark(name="a", created=1640995200, tags=["python"]),
+            Folder(name="f1", content=[
+                Bookmark(name="b", created=1641081600, tags=["web"]),
+            ]),
+        ])
+        metrics = gather_metrics(week)
+
+        differentiate_metrics(week, metrics, metrics)
+
+        for core in (metrics.bookmarks, metrics.folders, metrics.tags):
+            assert core.delta == 0
+            assert core.added == set() and core.added_count == 0
+            assert core.deleted == set() and core.deleted_count == 0
+        assert metrics.bookmarks.new_bookmarks == []
+
 
 class TestGatherMetrics:
     """Tests for the gather_metrics function."""
@@ -541,7 +517,6 @@ class TestGatherMetrics:
             mock_metrics = Mock()
             MockMetrics.return_value = mock_metrics
 
-            mock_gather.return_value = Counter({"folder1": 5, "folder2": 3})
             mock_avg.return_value = 4.0
             mock_largest.return_value = (
                 [(1, 5, ["folder1"])], [(2, 3, ["folder2"])])
@@ -572,6 +547,61 @@ class TestGatherMetrics:
 
             assert result == mock_metrics
 
+    @pytest.mark.metrics
+    def test_gather_metrics_ranks_folder_sizes(self):
+        """Test that folder rankings come from the sizes gathered in the walk."""
+        inner = Folder(name="inner", depth=1, content=[
+            Bookmark(name="b1", created=1, tags=["a"]),
+        ])
+        root = Folder(content=[
+            inner,
+            Bookmark(name="b2", created=2, tags=["a", "b"]),
+            Bookmark(name="b3", created=3, tags=["b"]),
+        ])
+
+        result = gather_metrics(root)
+
+        assert result.folders.sizes == Counter({"(root)": 3, "inner": 1})
+        assert result.folders.top_n == [(1, 3, ["(root)"]), (2, 1, ["inner"])]
+        assert result.folders.max_depth == 1
+        assert result.bookmarks.count == 3
+        assert result.tags.sizes == Counter({"a": 2, "b": 2})
+
+    @pytest.mark.metrics
+    def test_gather_metrics_sums_same_named_folders(self):
+        """Test that same-named sibling folders are ranked by their total."""
+        root = Folder(content=[
+            Folder(name="Dup", depth=1, content=[
+                Bookmark(name=f"b{n}", created=n) for n in range(1, 4)
+            ]),
+            Folder(name="Dup", depth=1, content=[
+                Bookmark(name="b4", created=4),
+            ]),
+        ])
+
+        result = gather_metrics(root)
+
+        assert result.folders.top_n == [(1, 4, ["Dup"]), (2, 2, ["(root)"])]
+        assert result.folders.sizes == Counter({"(root)": 2, "Dup": 1})
+
+    @pytest.mark.metrics
+    def test_gather_metrics_deep_tree(self):
+        """Test that trees deeper than the recursion limit are handled."""
+        depth = 3000
+        root = Folder()
+        folder = root
+        for level in range(1, depth + 1):
+            subfolder = Folder(name=f"f{level}", depth=level)
+            folder.content.append(subfolder)
+            folder = subfolder
+        folder.content.append(Bookmark(name="leaf", created=1, tags=["a"]))
+
+        result = gather_metrics(root)
+
+        assert result.folders.count == depth + 1
+        assert result.folders.max_depth == depth
+        assert result.bookmarks.items == {1}
+
 
 class TestMetricsIntegration:
     """Integration tests for metrics calculations."""
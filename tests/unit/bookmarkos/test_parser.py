@@ -4,27 +4,29 @@
 
 from collections import deque
 from io import StringIO
+from tempfile import SpooledTemporaryFile
 from unittest.mock import Mock, patch
 from bookmarkos.parser import (  # pyright: ignore[reportMissingImports]
-    process_dt, process_dd, process_folder, parse_bookmarks
+    process_dt, process_dd, process_folder, parse_bookmarks,
+    parse_bookmarks_from_lines
 )
 
 import pytest  # pyright: ignore[reportMissingImports]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_bookmark_line():
     """Sample bookmark line for testing."""
     return '    <DT><A HREF="https://example.com" ADD_DATE="1641921698" LAST_MODIFIED="1641921700">Example Site</A>'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_folder_line():
     """Sample folder line for testing."""
     return '    <DT><H3 ADD_DATE="1641921698" LAST_MODIFIED="1641921700">Test Folder</H3>'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dd_line():
     """Sample DD (notes) line for testing."""
     return '    <DD>This is a bookmark note'
@@ -77,12 +79,27 @@ class TestProcessDt:
                 # remaining queue after popping first item
                 deque(['    </DL><p>']),
                 ["root"],
-                1  # line_number + 1
+                1,  # line_number + 1
+                sort_children=True
             )
 
             # Verify subfolder added to parent
             folder.content.append.assert_called_once_with(mock_subfolder)
 
+    @pytest.mark.parser
+    def test_process_dt_folder_unsorted(self, sample_folder_line):
+        """Test that sort_children is passed along for a folder."""
+        folder = Mock()
+        folder.content = Mock()
+        queue = deque(['    <DL><p>', '    </DL><p>'])
+
+        with patch('bookmarkos.parser.process_folder') as mock_process_folder:
+            process_dt(sample_folder_line, queue, folder, [], sort_children=False)
+
+            assert mock_process_folder.call_args.kwargs == {
+                'sort_children': False
+            }
+
     @pytest.mark.parser
     def test_process_dt_folder_missing_dl(self, sample_folder_line):
         """Test processing a DT folder line without proper DL following."""
@@ -198,6 +215,20 @@ class TestProcessFolder:
 
             assert result == mock_folder
 
+    @pytest.mark.parser
+    def test_process_folder_unsorted(self):
+        """Test that folder content is left in input order when asked."""
+        queue = deque(['</DL><p>'])  # Just the closing tag
+
+        with patch('bookmarkos.parser.Folder') as MockFolder:
+            mock_folder = Mock()
+            mock_folder.content = Mock()  # Mock the content list
+            MockFolder.return_value.fill.return_value = mock_folder
+
+            process_folder('', queue, [], sort_children=False)
+
+            mock_folder.content.sort.assert_not_called()
+
     @pytest.mark.parser
     def test_process_folder_with_markup(self):
         """Test processing a folder with H3 markup."""
@@ -297,6 +328,45 @@ class TestProcessFolder:
             mock_process_dt.assert_called_once()
             assert result == mock_folder
 
+    @pytest.mark.parser
+    def test_process_folder_nested_folders(self):
+        """Test that nested folders are opened and closed in one pass."""
+        queue = deque([
+            '    <DT><H3 ADD_DATE="1" LAST_MODIFIED="2">Outer</H3>',
+            '    <DL><p>',
+            '        <DT><H3 ADD_DATE="3" LAST_MODIFIED="4">Inner</H3>',
+            '        <DL><p>',
+            '            <DT><A HREF="https://b.com" ADD_DATE="5" LAST_MODIFIED="6">B</A>',
+            '        </DL><p>',
+            '        <DT><A HREF="https://a.com" ADD_DATE="7" LAST_MODIFIED="8">A</A>',
+            '    </DL><p>',
+            '</DL><p>',
+            'trailing',
+        ])
+
+        result = process_folder('', queue, [])
+
+        outer = result.content[0]
+        assert outer.name == "Outer" and outer.depth == 1
+        assert outer.parent == [""]
+        assert [item.name for item in outer.content] == ["A", "Inner"]
+        inner = outer.content[1]
+        assert inner.depth == 2 and inner.parent == ["", "Outer"]
+        assert inner.content[0].parent == ["", "Outer", "Inner"]
+        assert queue == deque(['trailing'])
+
+    @pytest.mark.parser
+    def test_process_folder_nested_missing_dl(self):
+        """Test that a sub-folder without its opening <DL> is an error."""
+        queue = deque([
+            '    <DT><H3 ADD_DATE="1" LAST_MODIFIED="2">Outer</H3>',
+            '    <DT><A HREF="https://a.com" ADD_DATE="7" LAST_MODIFIED="8">A</A>',
+            '</DL><p>',
+        ])
+
+        with pytest.raises(ValueError, match="Missing opening <DL>"):
+            process_folder('', queue, [])
+
 
 class TestParseBookmarks:
     """Tests for the parse_bookmarks function."""
@@ -341,6 +411,27 @@ class TestParseBookmarks:
             mock_process_folder.assert_called_once()
             assert result == mock_root
 
+    @pytest.mark.parser
+    def test_parse_bookmarks_from_other_file_like(self):
+        """Test parsing bookmarks from a handle that isn't a TextIOWrapper."""
+        html_content = '''<!DOCTYPE NETSCAPE-Bookmark-file-1>
+<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">
+<TITLE>Bookmarks</TITLE>
+<H1>Bookmarks</H1>
+<DL><p>
+    <DT><A HREF="https://python.org" ADD_DATE="1" LAST_MODIFIED="2">Python</A>
+</DL><p>'''
+
+        with SpooledTemporaryFile(mode='w+') as file_handle:
+            file_handle.write(html_content)
+            file_handle.seek(0)
+
+            with patch('bookmarkos.parser.read_lines') as mock_read_lines:
+                result = parse_bookmarks(file_handle)
+
+            mock_read_lines.assert_not_called()
+            assert [item.name for item in result.content] == ["Python"]
+
     @pytest.mark.parser
     def test_parse_bookmarks_from_filename(self):
         """Test parsing bookmarks from filename."""
@@ -352,19 +443,43 @@ class TestParseBookmarks:
 <DL><p>
 </DL><p>'''
 
-        with patch('bookmarkos.parser.read_content') as mock_read_content, \
+        with patch('bookmarkos.parser.read_lines') as mock_read_lines, \
                 patch('bookmarkos.parser.process_folder') as mock_process_folder:
 
-            mock_read_content.return_value = html_content
+            mock_read_lines.return_value = iter(html_content.split("\n"))
             mock_root = Mock()
             mock_process_folder.return_value = mock_root
 
             result = parse_bookmarks(filename)
 
-            mock_read_content.assert_called_once_with(filename)
+            mock_read_lines.assert_called_once_with(filename)
             mock_process_folder.assert_called_once()
             assert result == mock_root
 
+    @pytest.mark.parser
+    def test_parse_bookmarks_from_lines(self):
+        """Test parsing bookmarks from a list of lines."""
+        lines = [
+            '<!DOCTYPE NETSCAPE-Bookmark-file-1>',
+            '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">',
+            '<TITLE>Bookmarks</TITLE>',
+            '<H1>Bookmarks</H1>',
+            '<DL><p>',
+            '    <DT><A HREF="https://python.org" ADD_DATE="1" LAST_MODIFIED="2">Python</A>',
+            '</DL><p>',
+        ]
+
+        result = parse_bookmarks_from_lines(lines)
+
+        assert result == parse_bookmarks("\n".join(lines))
+        assert [item.name for item in result.content] == ["Python"]
+
+    @pytest.mark.parser
+    def test_parse_bookmarks_from_lines_too_short(self):
+        """Test that fewer lines than the header needs is an error."""
+        with pytest.raises(ValueError, match="Expected at least 5 lines, got 2"):
+            parse_bookmarks_from_lines(["<!DOCTYPE NETSCAPE-Bookmark-file-1>", ""])
+
     @pytest.mark.parser
     def test_parse_bookmarks_missing_opening_dl(self):
         """Test parsing bookmarks with missing opening DL tag."""
@@ -399,15 +514,15 @@ class TestParseBookmarks:
         # Test with filename (not starting with DOCTYPE)
         filename = "bookmarks.html"
 
-        with patch('bookmarkos.parser.read_content') as mock_read_content, \
+        with patch('bookmarkos.parser.read_lines') as mock_read_lines, \
                 patch('bookmarkos.parser.process_folder') as mock_process_folder:
 
-            mock_read_content.return_value = doctype_content
+            mock_read_lines.return_value = iter(doctype_content.split("\n"))
             mock_root = Mock()
             mock_process_folder.return_value = mock_root
 
             parse_bookmarks(filename)
-            mock_read_content.assert_called_once_with(filename)
+            mock_read_lines.assert_called_once_with(filename)
 
     @pytest.mark.integration
     def test_parse_bookmarks_realistic_content(self):
@@ -435,3 +550,26 @@ class TestParseBookmarks:
         except ImportError:
             # Skip if actual modules aren't available (expected in isolated test env)
             pytest.skip("Integration test requires actual module imports")
+
+    @pytest.mark.integration
+    def test_parse_bookmarks_many_bookmarks(self):
+        """Integration test with a large, generated list of bookmarks."""
+        count = 1000
+        lines = [
+            '<!DOCTYPE NETSCAPE-Bookmark-file-1>',
+            '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">',
+            '<TITLE>Bookmarks</TITLE>',
+            '<H1>Bookmarks</H1>',
+            '<DL><p>',
+        ]
+        lines.extend(
+            f'    <DT><A HREF="https://example.com/{i}" ADD_DATE="1641921698" LAST_MODIFIED="1641921699">Example {i}</A>'
+            for i in range(count)
+        )
+        lines.append('</DL><p>')
+
+        result = parse_bookmarks("\n".join(lines))
+
+        assert len(result.content) == count
+        assert result.content[0].name == 'Example 0'
+        assert result.content[-1].url == f'https://example.com/{count - 1}'